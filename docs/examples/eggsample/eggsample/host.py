@@ -1,5 +1,5 @@
 import itertools
-import random
+from types import MappingProxyType
 
 from eggsample import hookspecs
 from eggsample import lib
@@ -7,7 +7,9 @@ from eggsample import lib
 import pluggy
 
 
-condiments_tray = {"pickled walnuts": 13, "steak sauce": 4, "mushy peas": 2}
+condiments_tray = MappingProxyType(
+    {"pickled walnuts": 13, "steak sauce": 4, "mushy peas": 2}
+)
 
 
 def main():
@@ -43,14 +45,16 @@ class EggsellentCook:
         self.ingredients = my_ingredients + other_ingredients
 
     def prepare_the_food(self):
-        random.shuffle(self.ingredients)
+        from random import shuffle
+
+        shuffle(self.ingredients)
 
     def serve_the_food(self):
-        condiment_comments = self.hook.eggsample_prep_condiments(
-            condiments=condiments_tray
-        )
+        # Plugins may mess with the tray, so hand them a fresh copy.
+        tray = dict(condiments_tray)
+        condiment_comments = self.hook.eggsample_prep_condiments(condiments=tray)
         print(f"Your food. Enjoy some {', '.join(self.ingredients)}")
-        print(f"Some condiments? We have {', '.join(condiments_tray.keys())}")
+        print(f"Some condiments? We have {', '.join(tray)}")
         if any(condiment_comments):
             print("\n".join(condiment_comments))
 
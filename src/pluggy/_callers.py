@@ -41,10 +41,12 @@ def _raise_wrapfail(
 def _warn_teardown_exception(
     hook_name: str, hook_impl: HookImpl, e: BaseException
 ) -> None:
-    msg = "A plugin raised an exception during an old-style hookwrapper teardown.\n"
-    msg += f"Plugin: {hook_impl.plugin_name}, Hook: {hook_name}\n"
-    msg += f"{type(e).__name__}: {e}\n"
-    msg += "For more information see https://pluggy.readthedocs.io/en/stable/api_reference.html#pluggy.PluggyTeardownRaisedWarning"  # noqa: E501
+    msg = (
+        "A plugin raised an exception during an old-style hookwrapper teardown.\n"
+        f"Plugin: {hook_impl.plugin_name}, Hook: {hook_name}\n"
+        f"{type(e).__name__}: {e}\n"
+        "For more information see https://pluggy.readthedocs.io/en/stable/api_reference.html#pluggy.PluggyTeardownRaisedWarning"  # noqa: E501
+    )
     warnings.warn(PluggyTeardownRaisedWarning(msg), stacklevel=5)
 
 
@@ -60,6 +62,9 @@ def _multicall(
     ``caller_kwargs`` comes from HookCaller.__call__().
     """
     __tracebackhide__ = True
+    if not hook_impls:
+        # Common for hooks nothing implements; skip the call machinery.
+        return None if firstresult else []
     results: list[object] = []
     exception = None
     only_new_style_wrappers = True
@@ -68,7 +73,7 @@ def _multicall(
         try:
             for hook_impl in reversed(hook_impls):
                 try:
-                    args = [caller_kwargs[argname] for argname in hook_impl.argnames]
+                    args = hook_impl._get_args(caller_kwargs)
                 except KeyError:
                     for argname in hook_impl.argnames:
                         if argname not in caller_kwargs:
@@ -82,7 +87,7 @@ def _multicall(
                         # If this cast is not valid, a type error is raised below,
                         # which is the desired response.
                         res = hook_impl.function(*args)
-                        wrapper_gen = cast(Generator[None, Result[object], None], res)
+                        wrapper_gen = cast("Generator[None, Result[object], None]", res)
                         next(wrapper_gen)  # first yield
                         teardowns.append((wrapper_gen, hook_impl))
                     except StopIteration:
@@ -92,7 +97,7 @@ def _multicall(
                         # If this cast is not valid, a type error is raised below,
                         # which is the desired response.
                         res = hook_impl.function(*args)
-                        function_gen = cast(Generator[None, object, object], res)
+                        function_gen = cast("Generator[None, object, object]", res)
                         next(function_gen)  # first yield
                         teardowns.append(function_gen)
                     except StopIteration:
@@ -9,8 +9,15 @@ from collections.abc import Mapping
 from collections.abc import Sequence
 from collections.abc import Set
 import inspect
+from operator import itemgetter
 import sys
+from types import BuiltinFunctionType
+from types import ClassMethodDescriptorType
+from types import FunctionType
+from types import MethodDescriptorType
+from types import MethodType
 from types import ModuleType
+from types import WrapperDescriptorType
 from typing import Any
 from typing import Callable
 from typing import Final
@@ -22,6 +29,7 @@ from typing import TypedDict
 from typing import TypeVar
 from typing import Union
 import warnings
+import weakref
 
 from ._result import Result
 
@@ -290,56 +298,108 @@ def normalize_hookimpl_opts(opts: HookimplOpts) -> None:
 _PYPY = hasattr(sys, "pypy_version_info")
 
 
-def varnames(func: object) -> tuple[tuple[str, ...], tuple[str, ...]]:
+# Exact types of the routines typically found when scanning dir() of a plugin,
+# most of them inherited from ``object``. Checking these first is a lot cheaper
+# than going through all of inspect.isroutine()'s checks.
+_ROUTINE_TYPES: Final = frozenset(
+    (
+        FunctionType,
+        MethodType,
+        BuiltinFunctionType,
+        MethodDescriptorType,
+        WrapperDescriptorType,
+        ClassMethodDescriptorType,
+    )
+)
+
+
+def _isroutine(obj: object) -> bool:
+    return type(obj) in _ROUTINE_TYPES or inspect.isroutine(obj)
+
+
+_VarNames = tuple[tuple[str, ...], tuple[str, ...]]
+
+# Signature parsing is slow and the same functions get parsed over and over
+# (e.g. a plugin class registered once per instance), so memoize the argument
+# names per function, before any implicit instance arg is stripped.
+_varnames_cache: weakref.WeakKeyDictionary[object, _VarNames] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _function_varnames(func: object) -> _VarNames:
+    # Fast path for plain functions, avoiding inspect.signature(). Wrapped
+    # functions and those with an explicit signature are left to inspect.
+    if type(func) is FunctionType and not (
+        "__wrapped__" in func.__dict__ or "__signature__" in func.__dict__
+    ):
+        code = func.__code__
+        args = code.co_varnames[: code.co_argcount]
+        defaults = func.__defaults__
+    else:
+        # func MUST be a function or method here or we won't parse any args.
+        sig = inspect.signature(func)  # type:ignore[arg-type]
+
+        _valid_param_kinds = (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        )
+        _valid_params = {
+            name: param
+            for name, param in sig.parameters.items()
+            if param.kind in _valid_param_kinds
+        }
+        # Names in code objects are interned by the compiler; names coming
+        # from a custom __signature__ may not be, so intern them to keep
+        # the per-call kwargs lookups on the identity fast path.
+        args = tuple(map(sys.intern, _valid_params))
+        defaults = (
+            tuple(
+                param.default
+                for param in _valid_params.values()
+                if param.default is not param.empty
+            )
+            or None
+        )
+
+    if defaults:
+        index = -len(defaults)
+        return args[:index], tuple(args[index:])
+    else:
+        return args, ()
+
+
+def varnames(func: object) -> _VarNames:
     """Return tuple of positional and keywrord argument names for a function,
     method, class or callable.
 
     In case of a class, its ``__init__`` method is considered.
     For methods the ``self`` parameter is not included.
     """
-    if inspect.isclass(func):
+    if isinstance(func, type):
         try:
-            func = func.__init__
+            func = func.__init__  # type:ignore[misc]
         except AttributeError:
             return (), ()
-    elif not inspect.isroutine(func):  # callable object?
+    elif not _isroutine(func):  # callable object?
         try:
             func = getattr(func, "__call__", func)
         except Exception:
             return (), ()
 
+    is_method = isinstance(func, MethodType)
+    target = func.__func__ if is_method else func  # type:ignore[attr-defined]
     try:
-        # func MUST be a function or method here or we won't parse any args.
-        sig = inspect.signature(
-            func.__func__ if inspect.ismethod(func) else func  # type:ignore[arg-type]
-        )
-    except TypeError:
-        return (), ()
-
-    _valid_param_kinds = (
-        inspect.Parameter.POSITIONAL_ONLY,
-        inspect.Parameter.POSITIONAL_OR_KEYWORD,
-    )
-    _valid_params = {
-        name: param
-        for name, param in sig.parameters.items()
-        if param.kind in _valid_param_kinds
-    }
-    args = tuple(_valid_params)
-    defaults = (
-        tuple(
-            param.default
-            for param in _valid_params.values()
-            if param.default is not param.empty
-        )
-        or None
-    )
-
-    if defaults:
-        index = -len(defaults)
-        args, kwargs = args[:index], tuple(args[index:])
-    else:
-        kwargs = ()
+        args, kwargs = _varnames_cache[target]
+    except (KeyError, TypeError):  # TypeError: not weak-referenceable
+        try:
+            args, kwargs = _function_varnames(target)
+        except TypeError:
+            return (), ()
+        try:
+            _varnames_cache[target] = args, kwargs
+        except TypeError:
+            pass
 
     # strip any implicit instance arg
     # pypy3 uses "obj" instead of "self" for default dunder methods
@@ -349,12 +409,45 @@ def varnames(func: object) -> tuple[tuple[str, ...], tuple[str, ...]]:
         implicit_names = ("self", "obj")
     if args:
         qualname: str = getattr(func, "__qualname__", "")
-        if inspect.ismethod(func) or ("." in qualname and args[0] in implicit_names):
+        if is_method or ("." in qualname and args[0] in implicit_names):
             args = args[1:]
 
     return args, kwargs
 
 
+_ArgsGetter = Callable[[Mapping[str, object]], Sequence[object]]
+# Hook implementations of the same hook mostly share their argument names,
+# so share their getters too.
+_args_getters: dict[tuple[str, ...], _ArgsGetter] = {}
+
+
+def _args_getter(argnames: tuple[str, ...]) -> _ArgsGetter:
+    """Return a function extracting the values of ``argnames``, in order, from
+    the keyword arguments of a hook call.
+
+    Raises :exc:`KeyError` if an argument is missing.
+    """
+    getter = _args_getters.get(argnames)
+    if getter is not None:
+        return getter
+    if not argnames:
+
+        def getter(kwargs: Mapping[str, object]) -> Sequence[object]:
+            return ()
+
+    elif len(argnames) == 1:
+        (argname,) = argnames
+
+        def getter(kwargs: Mapping[str, object]) -> Sequence[object]:
+            return (kwargs[argname],)
+
+    else:
+        # Unlike a comprehension, itemgetter does the lookups in C.
+        getter = itemgetter(*argnames)
+    _args_getters[argnames] = getter
+    return getter
+
+
 @final
 class HookRelay:
     """Hook holder object for performing 1:N hook calls where N is the number
@@ -385,6 +478,7 @@ class HookCaller:
         "spec",
         "_hookexec",
         "_hookimpls",
+        "_hookimpls_snapshot",
         "_call_history",
     )
 
@@ -407,6 +501,11 @@ class HookCaller:
         # 5. wrappers
         # 6. tryfirst wrappers
         self._hookimpls: Final[list[HookImpl]] = []
+        # Immutable copy of _hookimpls which is handed to the hook executor,
+        # because plugins may register other plugins during iteration (#438).
+        # Built on demand, so registering many impls in a row doesn't copy the
+        # list each time. Must be reset after each change to _hookimpls.
+        self._hookimpls_snapshot: tuple[HookImpl, ...] | None = None
         self._call_history: _CallHistory | None = None
         # TODO: Document, or make private.
         self.spec: HookSpec | None = None
@@ -441,6 +540,7 @@ class HookCaller:
         for i, method in enumerate(self._hookimpls):
             if method.plugin == plugin:
                 del self._hookimpls[i]
+                self._hookimpls_snapshot = None
                 return
         raise ValueError(f"plugin {plugin!r} not found")
 
@@ -450,40 +550,44 @@ class HookCaller:
 
     def _add_hookimpl(self, hookimpl: HookImpl) -> None:
         """Add an implementation to the callback chain."""
-        for i, method in enumerate(self._hookimpls):
-            if method.hookwrapper or method.wrapper:
-                splitpoint = i
-                break
-        else:
-            splitpoint = len(self._hookimpls)
-        if hookimpl.hookwrapper or hookimpl.wrapper:
-            start, end = splitpoint, len(self._hookimpls)
-        else:
-            start, end = 0, splitpoint
-
+        # The hookimpls list is sorted by _hookimpl_order, find the insertion
+        # point with a binary search. A new trylast impl goes before its
+        # equals, any other impl after them.
+        hookimpls = self._hookimpls
+        order = _hookimpl_order(hookimpl)
+        lo, hi = 0, len(hookimpls)
         if hookimpl.trylast:
-            self._hookimpls.insert(start, hookimpl)
-        elif hookimpl.tryfirst:
-            self._hookimpls.insert(end, hookimpl)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if _hookimpl_order(hookimpls[mid]) < order:
+                    lo = mid + 1
+                else:
+                    hi = mid
         else:
-            # find last non-tryfirst method
-            i = end - 1
-            while i >= start and self._hookimpls[i].tryfirst:
-                i -= 1
-            self._hookimpls.insert(i + 1, hookimpl)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if order < _hookimpl_order(hookimpls[mid]):
+                    hi = mid
+                else:
+                    lo = mid + 1
+        hookimpls.insert(lo, hookimpl)
+        self._hookimpls_snapshot = None
 
     def __repr__(self) -> str:
         return f"<HookCaller {self.name!r}>"
 
-    def _verify_all_args_are_provided(self, kwargs: Mapping[str, object]) -> None:
+    def _verify_all_args_are_provided(
+        self, spec: HookSpec | None, kwargs: Mapping[str, object]
+    ) -> None:
         # This is written to avoid expensive operations when not needed.
-        if self.spec:
-            for argname in self.spec.argnames:
+        # The spec is passed in as it is a property on _SubsetHookCaller.
+        if spec:
+            for argname in spec.argnames:
                 if argname not in kwargs:
                     notincall = ", ".join(
                         repr(argname)
-                        for argname in self.spec.argnames
-                        # Avoid self.spec.argnames - kwargs.keys() - doesn't preserve order.
+                        for argname in spec.argnames
+                        # Avoid spec.argnames - kwargs.keys() - doesn't preserve order.
                         if argname not in kwargs.keys()
                     )
                     warnings.warn(
@@ -503,12 +607,19 @@ class HookCaller:
         :ref:`calling`.
         """
         assert (
-            not self.is_historic()
+            self._call_history is None
         ), "Cannot directly call a historic hook - use call_historic instead."
-        self._verify_all_args_are_provided(kwargs)
-        firstresult = self.spec.opts.get("firstresult", False) if self.spec else False
-        # Copy because plugins may register other plugins during iteration (#438).
-        return self._hookexec(self.name, self._hookimpls.copy(), kwargs, firstresult)
+        # Read the spec once, it is a property on _SubsetHookCaller.
+        spec = self.spec
+        if spec is None:
+            firstresult = False
+        else:
+            self._verify_all_args_are_provided(spec, kwargs)
+            firstresult = spec.opts.get("firstresult", False)
+        hookimpls = self._hookimpls_snapshot
+        if hookimpls is None:
+            hookimpls = self._hookimpls_snapshot = tuple(self._hookimpls)
+        return self._hookexec(self.name, hookimpls, kwargs, firstresult)
 
     def call_historic(
         self,
@@ -524,13 +635,16 @@ class HookCaller:
             from a hook implementation.
         """
         assert self._call_history is not None
-        kwargs = kwargs or {}
-        self._verify_all_args_are_provided(kwargs)
+        if kwargs is None:
+            kwargs = {}
+        self._verify_all_args_are_provided(self.spec, kwargs)
         self._call_history.append((kwargs, result_callback))
         # Historizing hooks don't return results.
         # Remember firstresult isn't compatible with historic.
-        # Copy because plugins may register other plugins during iteration (#438).
-        res = self._hookexec(self.name, self._hookimpls.copy(), kwargs, False)
+        hookimpls = self._hookimpls_snapshot
+        if hookimpls is None:
+            hookimpls = self._hookimpls_snapshot = tuple(self._hookimpls)
+        res = self._hookexec(self.name, hookimpls, kwargs, False)
         if result_callback is None:
             return
         if isinstance(res, list):
@@ -544,9 +658,9 @@ class HookCaller:
         methods using the specified ``kwargs`` as call parameters, see
         :ref:`call_extra`."""
         assert (
-            not self.is_historic()
+            self._call_history is None
         ), "Cannot directly call a historic hook - use call_historic instead."
-        self._verify_all_args_are_provided(kwargs)
+        self._verify_all_args_are_provided(self.spec, kwargs)
         opts: HookimplOpts = {
             "wrapper": False,
             "hookwrapper": False,
@@ -573,8 +687,7 @@ class HookCaller:
 
     def _maybe_apply_history(self, method: HookImpl) -> None:
         """Apply call history to a new hookimpl if it is marked as historic."""
-        if self.is_historic():
-            assert self._call_history is not None
+        if self._call_history is not None:
             for kwargs, result_callback in self._call_history:
                 res = self._hookexec(self.name, [method], kwargs, False)
                 if res and result_callback is not None:
@@ -587,6 +700,18 @@ class HookCaller:
 _HookCaller = HookCaller
 
 
+def _hookimpl_order(hookimpl: HookImpl) -> tuple[bool, int]:
+    """The position of a hookimpl in the (reversed) call order, see
+    ``HookCaller._hookimpls``."""
+    if hookimpl.trylast:
+        priority = 0
+    elif hookimpl.tryfirst:
+        priority = 2
+    else:
+        priority = 1
+    return hookimpl.hookwrapper or hookimpl.wrapper, priority
+
+
 class _SubsetHookCaller(HookCaller):
     """A proxy to another HookCaller which manages calls to all registered
     plugins except the ones from remove_plugins."""
@@ -620,6 +745,10 @@ class _SubsetHookCaller(HookCaller):
             if impl.plugin not in self._remove_plugins
         ]
 
+    @property
+    def _hookimpls_snapshot(self) -> tuple[HookImpl, ...]:  # type: ignore[override]
+        return tuple(self._hookimpls)
+
     @property
     def spec(self) -> HookSpec | None:  # type: ignore[override]
         return self._orig.spec
@@ -648,6 +777,7 @@ class HookImpl:
         "optionalhook",
         "tryfirst",
         "trylast",
+        "_get_args",
     )
 
     def __init__(
@@ -665,6 +795,8 @@ class HookImpl:
         self.argnames: Final = argnames
         #: The keyword parameter names of ``function```.
         self.kwargnames: Final = kwargnames
+        # Extracts the positional arguments from the hook call kwargs.
+        self._get_args: Final = _args_getter(argnames)
         #: The plugin which defined this hook implementation.
         self.plugin: Final = plugin
         #: The :class:`HookimplOpts` used to configure this hook implementation.
@@ -15,6 +15,7 @@ import warnings
 from . import _tracing
 from ._callers import _multicall
 from ._hooks import _HookImplFunction
+from ._hooks import _isroutine
 from ._hooks import _Namespace
 from ._hooks import _Plugin
 from ._hooks import _SubsetHookCaller
@@ -64,10 +65,15 @@ class DistFacade:
 
     def __init__(self, dist: importlib.metadata.Distribution) -> None:
         self._dist = dist
+        self._project_name: str | None = None
 
     @property
     def project_name(self) -> str:
-        name: str = self.metadata["name"]
+        # Distribution.metadata reads and parses the metadata file on every
+        # access, so only do it once.
+        name = self._project_name
+        if name is None:
+            name = self._project_name = self.metadata["name"]
         return name
 
     def __getattr__(self, attr: str, default: Any | None = None) -> Any:
@@ -98,6 +104,9 @@ class PluginManager:
         #: The project name.
         self.project_name: Final = project_name
         self._name2plugin: Final[dict[str, _Plugin]] = {}
+        # Reverse index of _name2plugin for registered plugins, keyed by id()
+        # because plugins need not be hashable.
+        self._plugin2name: Final[dict[int, str]] = {}
         self._plugin_distinfo: Final[list[tuple[_Plugin, DistFacade]]] = []
         #: The "hook relay", used to call a hook on all registered plugins.
         #: See :ref:`calling`.
@@ -107,6 +116,10 @@ class PluginManager:
             "pluginmanage"
         )
         self._inner_hookexec = _multicall
+        # Attribute names of the hookimpl/hookspec options set by the markers,
+        # looked up for every item of every scanned plugin/namespace.
+        self._impl_attr: Final = project_name + "_impl"
+        self._spec_attr: Final = project_name + "_spec"
 
     def _hookexec(
         self,
@@ -151,6 +164,7 @@ class PluginManager:
         # XXX if an error happens we should make sure no state has been
         # changed at point of return
         self._name2plugin[plugin_name] = plugin
+        self._plugin2name[id(plugin)] = plugin_name
 
         # register matching hook implementations of the plugin
         for name in dir(plugin):
@@ -182,12 +196,10 @@ class PluginManager:
         options for items decorated with :class:`HookimplMarker`.
         """
         method: object = getattr(plugin, name)
-        if not inspect.isroutine(method):
+        if not _isroutine(method):
             return None
         try:
-            res: HookimplOpts | None = getattr(
-                method, self.project_name + "_impl", None
-            )
+            res: HookimplOpts | None = getattr(method, self._impl_attr, None)
         except Exception:
             res = {}  # type: ignore[assignment]
         if res is not None and not isinstance(res, dict):
@@ -221,9 +233,10 @@ class PluginManager:
                 hookcaller._remove_plugin(plugin)
 
         # if self._name2plugin[name] == None registration was blocked: ignore
-        if self._name2plugin.get(name):
-            assert name is not None
+        registered = self._name2plugin.get(name)
+        if registered is not None:
             del self._name2plugin[name]
+            self._plugin2name.pop(id(registered), None)
 
         return plugin
 
@@ -287,7 +300,7 @@ class PluginManager:
         options for items decorated with :class:`HookspecMarker`.
         """
         method = getattr(module_or_class, name)
-        opts: HookspecOpts | None = getattr(method, self.project_name + "_spec", None)
+        opts: HookspecOpts | None = getattr(method, self._spec_attr, None)
         return opts
 
     def get_plugins(self) -> set[Any]:
@@ -320,6 +333,10 @@ class PluginManager:
     def get_name(self, plugin: _Plugin) -> str | None:
         """Return the name the plugin is registered under, or ``None`` if
         is isn't."""
+        name = self._plugin2name.get(id(plugin))
+        if name is not None:
+            return name
+        # Not registered as such, but may compare equal to a registered plugin.
         for name, val in self._name2plugin.items():
             if plugin == val:
                 return name
@@ -338,7 +355,7 @@ class PluginManager:
             _warn_for_function(hook.spec.warn_on_impl, hookimpl.function)
 
         # positional arg checking
-        notinspec = set(hookimpl.argnames) - set(hook.spec.argnames)
+        notinspec = set(hookimpl.argnames).difference(hook.spec.argnames)
         if notinspec:
             raise PluginValidationError(
                 hookimpl.plugin,
@@ -407,9 +424,8 @@ class PluginManager:
                 if (
                     ep.group != group
                     or (name is not None and ep.name != name)
-                    # already registered
-                    or self.get_plugin(ep.name)
-                    or self.is_blocked(ep.name)
+                    # already registered or blocked
+                    or ep.name in self._name2plugin
                 ):
                     continue
                 plugin = ep.load()
@@ -467,9 +483,14 @@ class PluginManager:
             firstresult: bool,
         ) -> object | list[object]:
             before(hook_name, hook_impls, caller_kwargs)
-            outcome = Result.from_call(
-                lambda: oldcall(hook_name, hook_impls, caller_kwargs, firstresult)
-            )
+            # Not using Result.from_call() to avoid a closure and an extra
+            # frame per traced hook call.
+            try:
+                res = oldcall(hook_name, hook_impls, caller_kwargs, firstresult)
+            except BaseException as exc:
+                outcome: Result[object | list[object]] = Result(None, exc)
+            else:
+                outcome = Result(res, None)
             after(outcome, hook_name, hook_impls, caller_kwargs)
             return outcome.get_result()
 
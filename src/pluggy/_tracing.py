@@ -27,26 +27,23 @@ class TagTracer:
             extra = args[-1]
             args = args[:-1]
         else:
-            extra = {}
+            extra = None
 
         content = " ".join(map(str, args))
         indent = "  " * self.indent
 
-        lines = ["{}{} [{}]\n".format(indent, content, ":".join(tags))]
-
-        for name, value in extra.items():
-            lines.append(f"{indent}    {name}: {value}\n")
-
-        return "".join(lines)
+        message = "{}{} [{}]\n".format(indent, content, ":".join(tags))
+        if not extra:
+            return message
+        return message + "".join(
+            f"{indent}    {name}: {value}\n" for name, value in extra.items()
+        )
 
     def _processmessage(self, tags: tuple[str, ...], args: tuple[object, ...]) -> None:
         if self._writer is not None and args:
             self._writer(self._format_message(tags, args))
-        try:
-            processor = self._tags2proc[tags]
-        except KeyError:
-            pass
-        else:
+        processor = self._tags2proc.get(tags)
+        if processor is not None:
             processor(tags, args)
 
     def setwriter(self, writer: _Writer | None) -> None:
@@ -61,12 +58,18 @@ class TagTracer:
 
 
 class TagTracerSub:
+    __slots__ = ("root", "tags")
+
     def __init__(self, root: TagTracer, tags: tuple[str, ...]) -> None:
         self.root = root
         self.tags = tags
 
     def __call__(self, *args: object) -> None:
-        self.root._processmessage(self.tags, args)
+        root = self.root
+        # Fast path: nobody is listening.
+        if root._writer is None and self.tags not in root._tags2proc:
+            return
+        root._processmessage(self.tags, args)
 
     def get(self, name: str) -> TagTracerSub:
         return self.__class__(self.root, self.tags + (name,))
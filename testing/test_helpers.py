@@ -68,6 +68,21 @@ def test_varnames_keyword_only() -> None:
     assert varnames(f3) == ((), ("x",))
 
 
+def test_varnames_positional_only() -> None:
+    def f(x, /, y, z=1) -> None:
+        pass
+
+    class A:
+        def f(self, x, /, y=2) -> None:
+            pass
+
+    assert varnames(f) == (("x", "y"), ("z",))
+    assert varnames(A.f) == (("x",), ("y",))
+    # Cached per function, bound methods still strip the instance arg.
+    assert varnames(A().f) == (("x",), ("y",))
+    assert varnames(A.f) == (("x",), ("y",))
+
+
 def test_formatdef() -> None:
     def function1():
         pass
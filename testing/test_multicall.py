@@ -76,6 +76,11 @@ def test_call_none_is_no_result() -> None:
     assert res == [1]
 
 
+def test_no_hookimpls() -> None:
+    assert MC([], {}) == []
+    assert MC([], {}, firstresult=True) is None
+
+
 def test_hookwrapper() -> None:
     out = []
 
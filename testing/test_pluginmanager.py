@@ -12,6 +12,7 @@ from pluggy import HookimplMarker
 from pluggy import HookspecMarker
 from pluggy import PluginManager
 from pluggy import PluginValidationError
+from pluggy._manager import DistFacade
 
 
 hookspec = HookspecMarker("example")
@@ -91,6 +92,37 @@ def test_pm_name(pm: PluginManager) -> None:
     assert not pm.get_plugins()
 
 
+def test_get_name(pm: PluginManager) -> None:
+    class Unhashable:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __eq__(self, other: object) -> bool:
+            return isinstance(other, Unhashable)
+
+    a1 = Unhashable()
+    assert pm.get_name(a1) is None
+    pm.register(a1, name="hello")
+    assert pm.get_name(a1) == "hello"
+    # Equal but not identical plugins are still found.
+    a2 = Unhashable()
+    assert pm.get_name(a2) == "hello"
+    pm.unregister(a2)
+    assert pm.get_name(a1) is None
+    pm.register(a1, name="world")
+    assert pm.get_name(a1) == "world"
+
+    class Falsy:
+        def __len__(self) -> int:
+            return 0
+
+    f = Falsy()
+    pm.register(f, name="falsy")
+    assert pm.get_name(f) == "falsy"
+    pm.set_blocked("falsy")
+    assert pm.get_name(f) is None
+    assert not pm.is_registered(f)
+
+
 def test_set_blocked(pm: PluginManager) -> None:
     class A:
         pass
@@ -604,6 +636,23 @@ def test_load_setuptools_instantiation(monkeypatch, pm: PluginManager) -> None:
     assert num == 0  # no plugin loaded by this call
 
 
+def test_distfacade_project_name() -> None:
+    class Distribution:
+        metadata_reads = 0
+
+        @property
+        def metadata(self):
+            self.metadata_reads += 1
+            return {"name": "myproject"}
+
+    dist = Distribution()
+    facade = DistFacade(dist)  # type: ignore[arg-type]
+    assert facade.project_name == "myproject"
+    assert facade.project_name == "myproject"
+    assert dist.metadata_reads == 1
+    assert facade.metadata_reads == 1
+
+
 def test_add_tracefuncs(he_pm: PluginManager) -> None:
     out: list[Any] = []
 